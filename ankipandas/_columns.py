@@ -122,6 +122,13 @@ value_maps = {
     "revs": {"rtype": {0: "learning", 1: "review", 2: "relearn", 3: "cram"}},
 }
 
+value_maps_inv = {
+    table: {
+        column: invert_dict(mapping) for column, mapping in col_maps.items()
+    }
+    for table, col_maps in value_maps.items()
+}
+
 dtype_casts: dict[str, dict[str, Any]] = {
     "notes": {},
     "cards": {},
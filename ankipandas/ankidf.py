@@ -2,9 +2,8 @@
 from __future__ import annotations
 
 import copy
-import pathlib
 import time
-from contextlib import closing
+from itertools import chain
 from sqlite3 import Connection
 from typing import Any, Iterable, Sequence
 
@@ -17,10 +16,15 @@ import ankipandas._columns as _columns
 # ours
 import ankipandas.raw as raw
 from ankipandas.util.checksum import field_checksum
-from ankipandas.util.dataframe import merge_dfs, replace_df_inplace
+from ankipandas.util.dataframe import (
+    factorized_map,
+    map_with_default,
+    merge_dfs,
+    replace_df_inplace,
+)
 from ankipandas.util.guid import guid as generate_guid
 from ankipandas.util.log import log
-from ankipandas.util.misc import flatten_list_list, invert_dict
+from ankipandas.util.misc import flatten_list_list
 from ankipandas.util.types import (
     is_dict_list_like,
     is_list_dict_like,
@@ -103,8 +107,10 @@ class AnkiDataFrame(pd.DataFrame):
         if empty:
             df = raw.get_empty_table(table)
         else:
-            with closing(col.db) as db:
-                df = raw.get_table(db, table)
+            # Don't close the connection here: it is cached on the
+            # Collection, and normalize() below reuses it (together with
+            # the per-connection lookup caches in ankipandas.raw).
+            df = raw.get_table(col.db, table)
 
         replace_df_inplace(self, df)
         self.normalize(inplace=True)
@@ -121,9 +127,18 @@ class AnkiDataFrame(pd.DataFrame):
     def equals(self, other):
         return pd.DataFrame(self).equals(other)
 
-    def append(self, *args, **kwargs):
-        ret = pd.DataFrame.append(self, *args, **kwargs)
-        ret.astype(_columns.dtype_casts2[self._anki_table])
+    def append(self, other, **kwargs):
+        kwargs.setdefault("copy", False)
+        ret = pd.concat([self, other], **kwargs).__finalize__(self)
+        # Only cast columns that concat actually upcast; astype copies the
+        # whole column even when the dtype already matches.
+        casts = {
+            col: typ
+            for col, typ in _columns.dtype_casts2[self._anki_table].items()
+            if ret[col].dtype != typ
+        }
+        if casts:
+            ret = ret.astype(casts)
         return ret
 
     def update(self, other, force=False, **kwargs):
@@ -162,8 +177,11 @@ class AnkiDataFrame(pd.DataFrame):
                     )
         super().update(other, **kwargs)
         # Fix https://github.com/pandas-dev/pandas/issues/4094
+        # Only cast columns whose dtype was actually clobbered, else we pay
+        # a full-column copy for nothing.
         for col, typ in _columns.dtype_casts2[self._anki_table].items():
-            self[col] = self[col].astype(typ)
+            if self[col].dtype != typ:
+                self[col] = self[col].astype(typ)
 
     # Checks
     # ==========================================================================
@@ -250,7 +268,7 @@ class AnkiDataFrame(pd.DataFrame):
             if "nid" in self.columns:
                 return self["nid"]
             else:
-                return self.cid.map(raw.get_cid2nid(self.db))
+                return map_with_default(self.cid, raw.get_cid2nid(self.db))
         else:
             self._invalid_table()
 
@@ -341,12 +359,16 @@ class AnkiDataFrame(pd.DataFrame):
                     " a good idea. Cannot get model ID anymore."
                 )
             else:
-                return self["nmodel"].map(raw.get_model2mid(self.db))
+                return map_with_default(
+                    self["nmodel"], raw.get_model2mid(self.db)
+                )
         if self._anki_table in ["revs", "cards"]:
             if "nmodel" in self.columns:
-                return self["nmodel"].map(raw.get_model2mid(self.db))
+                return map_with_default(
+                    self["nmodel"], raw.get_model2mid(self.db)
+                )
             else:
-                return self.nid.map(raw.get_nid2mid(self.db))
+                return map_with_default(self.nid, raw.get_nid2mid(self.db))
         else:
             self._invalid_table()
 
@@ -369,14 +391,14 @@ class AnkiDataFrame(pd.DataFrame):
                     "You seem to have removed the 'cdeck' column. That was not "
                     "a good idea. Cannot get deck ID anymore."
                 )
-            return self["cdeck"].map(raw.get_deck2did(self.db))
+            return map_with_default(self["cdeck"], raw.get_deck2did(self.db))
         elif self._anki_table == "notes":
             raise ValueError(
                 "Notes can belong to multiple decks. Therefore it is impossible"
                 " to associate a deck ID with them."
             )
         elif self._anki_table == "revs":
-            return self.cid.map(raw.get_cid2did(self.db))
+            return map_with_default(self.cid, raw.get_cid2did(self.db))
         else:
             self._invalid_table()
 
@@ -401,10 +423,12 @@ class AnkiDataFrame(pd.DataFrame):
                     "You seem to have removed the 'odeck' column. That was not "
                     "a good idea. Cannot get original deck ID anymore."
                 )
-            return self["odeck"].map(raw.get_deck2did(self.db))
+            return map_with_default(self["odeck"], raw.get_deck2did(self.db))
         elif self._anki_table == "revs":
             if "odeck" in self.columns:
-                return self["odeck"].map(raw.get_deck2did(self.db))
+                return map_with_default(
+                    self["odeck"], raw.get_deck2did(self.db)
+                )
         elif self._anki_table == "notes":
             raise ValueError(
                 "The original deck ID (odid) is not available for the notes "
@@ -453,11 +477,19 @@ class AnkiDataFrame(pd.DataFrame):
                 "AnkiDataFrame was already initialized as a table of type"
                 " notes, therefore merge_notes() doesn't make any sense."
             )
-        elif self._anki_table == "revs":
+        elif self._anki_table == "revs" and "nid" not in self.columns:
+            # Only materialize the nid column if it's not already there;
+            # the property otherwise maps every cid through the cards table.
             self["nid"] = self.nid
+        # Only hand the notes we will actually join to merge_dfs; merging
+        # from a small filtered frame otherwise drags the full notes table
+        # through the rename/prepend machinery. Filtering the cached table
+        # (rather than re-reading from SQL) keeps user edits visible.
+        notes = self.col.notes
+        notes = notes[notes.index.isin(pd.unique(self["nid"].values))]
         ret = merge_dfs(
             df=self,
-            df_add=self.col.notes,
+            df_add=notes,
             id_df="nid",
             id_add="nid",
             inplace=inplace,
@@ -502,9 +534,12 @@ class AnkiDataFrame(pd.DataFrame):
                 "notes table."
             )
         self._check_our_format()
+        # As in merge_notes: restrict the merge source to the cards present.
+        cards = self.col.cards
+        cards = cards[cards.index.isin(pd.unique(self["cid"].values))]
         ret = merge_dfs(
             df=self,
-            df_add=self.col.cards,
+            df_add=cards,
             id_df="cid",
             inplace=inplace,
             columns=columns,
@@ -561,22 +596,37 @@ class AnkiDataFrame(pd.DataFrame):
         self._fields_format = "in_progress"
         # fixme: What if one field column is one that is already in use?
         prefix = self.fields_as_columns_prefix
-        mids = self.mid.unique()
+        # Hoisted out of the loop: the mid property and get_mid2fields go
+        # through the database, so evaluate them once per conversion, not
+        # once per model.
+        mid_series = self.mid
+        mids = mid_series.unique()
+        mid2fields = raw.get_mid2fields(self.db)
+        # Expand the field lists into a wide frame once for the whole table;
+        # the per-model loop below then only slices it.
+        expanded = pd.DataFrame(self["nflds"].tolist(), index=self.index)
+        # Create all missing field columns in one go instead of one
+        # insertion per field per model.
+        missing_columns = []
+        seen = set(self.columns)
         for mid in mids:
             if mid == 0:
                 continue
-            df_model = self[self.mid == mid]
-            fields = pd.DataFrame(df_model["nflds"].tolist())
-            field_names = raw.get_mid2fields(self.db)[mid]
-            for field in field_names:
-                if prefix + field not in self.columns:
-                    self[prefix + field] = ""
-            for ifield, field in enumerate(field_names):
-                # todo: can we speed this up?
-                self.loc[self.mid == mid, [prefix + field]] = pd.Series(
-                    fields[ifield].tolist(),
-                    index=self.loc[self.mid == mid].index,
-                )
+            for field in mid2fields[mid]:
+                column = prefix + field
+                if column not in seen:
+                    seen.add(column)
+                    missing_columns.append(column)
+        if missing_columns:
+            self[missing_columns] = ""
+        for mid in mids:
+            if mid == 0:
+                continue
+            mask = (mid_series == mid).to_numpy()
+            field_names = mid2fields[mid]
+            fields = expanded.loc[mask].reindex(columns=range(len(field_names)))
+            new_columns = [prefix + field for field in field_names]
+            self.loc[mask, new_columns] = fields.to_numpy()
         self.drop("nflds", axis=1, inplace=True)
         self._fields_format = "columns"
 
@@ -616,18 +666,28 @@ class AnkiDataFrame(pd.DataFrame):
             raise ValueError(f"Unknown _fields_format: {self._fields_format}")
 
         self._fields_format = "in_progress"
-        mids = self.mid.unique()
+        # As in fields_as_columns: evaluate the mid property once and reuse
+        # one boolean mask per model instead of recomputing it per access.
+        mid_series = self.mid
+        mids = mid_series.unique()
+        mid2fields = raw.get_mid2fields(self.db)
+        mid_arr = mid_series.to_numpy()
+        # Collect the field lists into one preallocated object array and
+        # assign the nflds column in a single shot at the end, instead of
+        # one aligned .loc write per model.
+        nflds = np.empty(len(self), dtype=object)
         to_drop = []
         for mid in mids:
-            fields = raw.get_mid2fields(self.db)[mid]
+            mask = mid_arr == mid
+            fields = mid2fields[mid]
             fields = [self.fields_as_columns_prefix + field for field in fields]
-            self.loc[self.mid == mid, "nflds"] = pd.Series(
-                self.loc[self.mid == mid, fields].values.tolist(),
-                index=self.loc[self.mid == mid].index,
-            )
+            nflds[mask] = pd.Series(
+                self.loc[mask, fields].values.tolist(), dtype=object
+            ).to_numpy()
             # Careful: Do not delete the fields here yet, other models
             # might still use them
             to_drop.extend(fields)
+        self["nflds"] = nflds
         self.drop(to_drop, axis=1, inplace=True)
         self._fields_format = "list"
 
@@ -649,9 +709,7 @@ class AnkiDataFrame(pd.DataFrame):
                 " or merge it into your table."
             )
         else:
-            return sorted(
-                {item for lst in self["ntags"].tolist() for item in lst}
-            )
+            return sorted(set(chain.from_iterable(self["ntags"].values)))
 
     def list_decks(self) -> list[str]:
         """Return sorted list of deck names in the current table."""
@@ -707,14 +765,29 @@ class AnkiDataFrame(pd.DataFrame):
             tags = [tags]
 
         if tags is not None:
-
-            def _has_tag(other):
-                return not set(tags).isdisjoint(other)
-
-            return self["ntags"].apply(_has_tag)
+            # Iterating over the raw object array beats Series.apply, which
+            # wraps every call; the frozenset is built once for all rows.
+            tag_set = frozenset(tags)
+            vals = self["ntags"].values
+            return pd.Series(
+                np.fromiter(
+                    (not tag_set.isdisjoint(other) for other in vals),
+                    dtype=bool,
+                    count=len(vals),
+                ),
+                index=self.index,
+            )
 
         else:
-            return self["ntags"].apply(bool)
+            vals = self["ntags"].values
+            return pd.Series(
+                np.fromiter(
+                    (len(other) > 0 for other in vals),
+                    dtype=bool,
+                    count=len(vals),
+                ),
+                index=self.index,
+            )
 
     def has_tags(self, tags: Iterable[str] | str | None = None):
         """Checks whether row contains at least the supplied tags.
@@ -742,8 +815,16 @@ class AnkiDataFrame(pd.DataFrame):
         self._check_tag_col()
         if isinstance(tags, str):
             tags = [tags]
-        _has_tags = set(tags).issubset
-        return self["ntags"].apply(_has_tags)
+        _has_tags = frozenset(tags).issubset
+        vals = self["ntags"].values
+        return pd.Series(
+            np.fromiter(
+                (_has_tags(other) for other in vals),
+                dtype=bool,
+                count=len(vals),
+            ),
+            index=self.index,
+        )
 
     def add_tag(self, tags: Sequence[str] | str, inplace=False):
         """Adds tag ('ntags' column).
@@ -768,10 +849,17 @@ class AnkiDataFrame(pd.DataFrame):
         if len(tags) == 0:
             return
 
+        tag_set = frozenset(tags)
+
         def _add_tags(other):
-            return other + sorted(set(tags) - set(other))
+            new = tag_set.difference(other)
+            if not new:
+                # Nothing to add: keep the existing list instead of
+                # allocating an identical copy.
+                return other
+            return other + sorted(new)
 
-        self["ntags"] = self["ntags"].apply(_add_tags)
+        self["ntags"] = [_add_tags(other) for other in self["ntags"].values]
 
     def remove_tag(self, tags: Iterable[str] | str | None, inplace=False):
         """Removes tag ('ntags' column).
@@ -794,14 +882,14 @@ class AnkiDataFrame(pd.DataFrame):
             tags = [tags]
 
         if tags is not None:
-
-            def _remove_tags(other):
-                return [tag for tag in other if tag not in tags]
-
-            self["ntags"] = self["ntags"].apply(_remove_tags)
+            tag_set = frozenset(tags)
+            self["ntags"] = [
+                [tag for tag in other if tag not in tag_set]
+                for other in self["ntags"].values
+            ]
 
         else:
-            self["ntags"] = self["ntags"].apply(lambda _: [])
+            self["ntags"] = [[] for _ in range(len(self))]
 
     # Compare
     # ==========================================================================
@@ -839,17 +927,23 @@ class AnkiDataFrame(pd.DataFrame):
 
         cols = sorted(set(self_sf.columns) & set(_other.columns))
 
-        other_nids = set(_other.index)
-        inters = set(self_sf.index & other_nids)
+        # Index.intersection/isin stay on the underlying int64 arrays
+        # instead of boxing every ID into a Python set.
+        inters = self_sf.index.intersection(_other.index)
+        self_mask = self_sf.index.isin(inters)
+        other_mask = _other.index.isin(inters)
         result = pd.Series(na, index=self_sf.index)
-        new_bools = np.any(
-            _other.loc[_other.index.isin(inters), cols].values
-            != self_sf.loc[self_sf.index.isin(inters), cols].values,
-            axis=1,
-        )
-        result.loc[self_sf.index.isin(inters)] = pd.Series(
-            new_bools, index=result[self_sf.index.isin(inters)].index
-        )
+        # Compare column by column rather than materializing both tables as
+        # one wide object array: peak memory stays at a single column and
+        # mixed dtypes don't force everything to object.
+        changed = np.zeros(int(self_mask.sum()), dtype=bool)
+        for col in cols:
+            changed |= np.asarray(
+                _other.loc[other_mask, col].values
+                != self_sf.loc[self_mask, col].values,
+                dtype=bool,
+            )
+        result.loc[self_mask] = changed
         return result
 
     def modified_columns(
@@ -872,20 +966,18 @@ class AnkiDataFrame(pd.DataFrame):
         if other is None:
             other = self.init_with_table(col=self.col, table=self._anki_table)
         cols = [c for c in self.columns if c in other.columns]
-        other_nids = set(other.index)
-        inters = set(self.index) & other_nids
+        inters = self.index.intersection(other.index)
         if only:
-            inters &= set(
-                self[self.was_modified(other=other, _force=_force)].index
+            inters = inters.intersection(
+                self.index[self.was_modified(other=other, _force=_force).values]
             )
-        inters_st = sorted(inters)
+        inters_st = inters.sort_values()
         del inters
-        return pd.DataFrame(
-            self.loc[inters_st, cols].values
-            != other.loc[inters_st, cols].values,
-            index=self.loc[inters_st].index,
-            columns=cols,
-        )
+        # One aligned gather per frame and a single C-level comparison,
+        # instead of a hashtable-probing .loc lookup per column.
+        ours = self.reindex(index=inters_st, columns=cols).to_numpy()
+        theirs = other.reindex(index=inters_st, columns=cols).to_numpy()
+        return pd.DataFrame(ours != theirs, index=inters_st, columns=cols)
 
     def was_added(self, other: pd.DataFrame | None = None, _force=False):
         """Compare with original table, show which rows were added.
@@ -904,12 +996,13 @@ class AnkiDataFrame(pd.DataFrame):
             self._check_our_format()
 
         if other is not None:
-            other_ids = set(other.index)
+            other_ids = other.index
         else:
-            other_ids = set(self.col._get_original_item(self._anki_table).id)
+            other_ids = pd.Index(
+                self.col._get_original_item(self._anki_table).id
+            )
 
-        new_indices = set(self.index) - other_ids
-        return self.index.isin(new_indices)
+        return ~self.index.isin(other_ids)
 
     def was_deleted(
         self, other: pd.DataFrame | None = None, _force=False
@@ -929,28 +1022,44 @@ class AnkiDataFrame(pd.DataFrame):
             self._check_our_format()
 
         if other is not None:
-            other_ids = set(other.index)
+            other_ids = other.index
         else:
-            other_ids = set(self.col._get_original_item(self._anki_table).id)
+            other_ids = pd.Index(
+                self.col._get_original_item(self._anki_table).id
+            )
 
-        deleted_indices = other_ids - set(self.index)
-        return sorted(deleted_indices)
+        # Index.difference already returns a sorted result
+        return other_ids.difference(self.index).tolist()
 
     # Update modification stamps and similar
     # ==========================================================================
 
-    def _set_usn(self):
-        """Update usn (update sequence number) for all changed rows."""
+    def _set_usn(self, _mask=None):
+        """Update usn (update sequence number) for all changed rows.
+
+        Args:
+            _mask: Precomputed modification mask (avoids re-reading the
+                original table when the caller already has one).
+        """
+        if _mask is None:
+            _mask = self.was_modified(na=True, _force=True)
         self.loc[
-            self.was_modified(na=True, _force=True),
+            _mask,
             _columns.columns_anki2ours[self._anki_table]["usn"],
         ] = -1
 
-    def _set_mod(self):
-        """Update modification timestamps for all changed rows."""
+    def _set_mod(self, _mask=None):
+        """Update modification timestamps for all changed rows.
+
+        Args:
+            _mask: Precomputed modification mask (avoids re-reading the
+                original table when the caller already has one).
+        """
         if self._anki_table in ["cards", "notes"]:
+            if _mask is None:
+                _mask = self.was_modified(na=True, _force=True)
             self.loc[
-                self.was_modified(na=True, _force=True),
+                _mask,
                 _columns.columns_anki2ours[self._anki_table]["mod"],
             ] = int(time.time())
 
@@ -958,7 +1067,11 @@ class AnkiDataFrame(pd.DataFrame):
     def _set_guid(self):
         """Update globally unique id"""
         if self._anki_table == "notes":
-            self.loc[~self["nguid"].apply(bool)].apply(generate_guid)
+            missing = self["nguid"].isna() | (self["nguid"] == "")
+            if missing.any():
+                self.loc[missing, "nguid"] = [
+                    generate_guid() for _ in range(int(missing.sum()))
+                ]
 
     # Raw and normalized
     # ==========================================================================
@@ -1002,7 +1115,8 @@ class AnkiDataFrame(pd.DataFrame):
         # ------
 
         for column, typ in _columns.dtype_casts[table].items():
-            self[column] = self[column].astype(typ)
+            if self[column].dtype != typ:
+                self[column] = self[column].astype(typ)
 
         # Renames
         # -------
@@ -1033,19 +1147,26 @@ class AnkiDataFrame(pd.DataFrame):
         self.set_index(id_field, inplace=True)
 
         if table == "cards":
-            self["cdeck"] = self["did"].map(raw.get_did2deck(self.db))
-            self["codeck"] = self["codid"].map(raw.get_did2deck(self.db))
+            # Fetch the mapping once for both columns; every self.db access
+            # opens a fresh connection.
+            did2deck = raw.get_did2deck(self.db)
+            # These columns only take a handful of distinct values (one per
+            # deck/model), so factorize and look each value up just once.
+            self["cdeck"] = factorized_map(self["did"], did2deck)
+            self["codeck"] = factorized_map(self["codid"], did2deck)
         elif table == "notes":
-            self["nmodel"] = self["mid"].map(raw.get_mid2model(self.db))
+            self["nmodel"] = factorized_map(
+                self["mid"], raw.get_mid2model(self.db)
+            )
 
         # Tags
         # ----
 
         if table == "notes":
-            # Tags as list, rather than string joined by space
-            self["ntags"] = self["ntags"].apply(
-                lambda joined: [item for item in joined.split(" ") if item]
-            )
+            # Tags as list, rather than string joined by space. Whitespace
+            # splitting via the str accessor drops empty items just like the
+            # previous per-row filter did, but without a Python call per row.
+            self["ntags"] = self["ntags"].str.split()
 
         # Fields
         # ------
@@ -1104,8 +1225,11 @@ class AnkiDataFrame(pd.DataFrame):
         # Update automatic fields
         # -----------------------
 
-        self._set_mod()
-        self._set_usn()
+        # One modification snapshot for both stamps; was_modified re-reads
+        # the original table from the database on every call.
+        modified = self.was_modified(na=True, _force=True)
+        self._set_mod(_mask=modified)
+        self._set_usn(_mask=modified)
         self._set_guid()
 
         # IDs
@@ -1115,70 +1239,79 @@ class AnkiDataFrame(pd.DataFrame):
         self.reset_index(inplace=True, drop=False)
 
         if table == "cards":
-            self["did"] = self["cdeck"].map(raw.get_deck2did(self.db))
-            self["odid"] = self["codeck"].map(raw.get_deck2did(self.db))
+            # As in normalize(): one lookup for both columns.
+            deck2did = raw.get_deck2did(self.db)
+            self["did"] = factorized_map(self["cdeck"], deck2did)
+            self["odid"] = factorized_map(self["codeck"], deck2did)
         if table == "notes":
-            self["mid"] = self["nmodel"].map(raw.get_model2mid(self.db))
+            self["mid"] = factorized_map(
+                self["nmodel"], raw.get_model2mid(self.db)
+            )
 
         # Fields & Hashes
         # ---------------
 
         if table == "notes":
-            if not self._fields_format == "list":
+            if self._fields_format != "list":
                 self.fields_as_list(inplace=True, force=True)
             # Check if success
-            if not self._fields_format == "list":
+            if self._fields_format != "list":
                 raise ValueError(
                     "It looks like the last call to fields_as_list or"
                     "fields_as_columns was not successful, so you better start "
                     "over."
                 )
 
-            # Restore the sort field.
-            mids = list(self["mid"].unique())
-            mid2sfld = raw.get_mid2sortfield(self.db)
-            for mid in mids:
-                sfield = mid2sfld[mid]
-                df_model = self[self["mid"] == mid]
-                fields = pd.DataFrame(df_model["nflds"].tolist())
-                self.loc[self["mid"] == mid, "nsfld"] = fields[sfield].tolist()
-
-            self["ncsum"] = self["nflds"].apply(
-                lambda lst: field_checksum(lst[0])
-            )
-
-            self["nflds"] = self["nflds"].str.join("\x1f")
+            # Restore the sort field: look up each row's sort field index
+            # and gather it from the expanded field matrix in one pass,
+            # instead of re-slicing the frame once per model.
+            if len(self):
+                mid2sfld = raw.get_mid2sortfield(self.db)
+                sfld_idx = map_with_default(self["mid"], mid2sfld).to_numpy()
+                flds_mat = pd.DataFrame(self["nflds"].tolist()).to_numpy()
+                self["nsfld"] = flds_mat[np.arange(len(self)), sfld_idx]
+
+            # The checksum itself is C code (hashlib); only the dispatch is
+            # Python, so a plain comprehension over the object array beats
+            # Series.apply's per-row boxing.
+            self["ncsum"] = [
+                field_checksum(lst[0]) for lst in self["nflds"].values
+            ]
+
+            # str.join re-validates every list element per row; a plain
+            # comprehension over the object array does the same join without
+            # the per-row dispatch.
+            self["nflds"] = ["\x1f".join(lst) for lst in self["nflds"].values]
 
         # Tags
         # ----
 
         if table == "notes" and "nflds" in self.columns:
-            self["ntags"] = self["ntags"].str.join(" ")
+            self["ntags"] = [" ".join(tags) for tags in self["ntags"].values]
 
         # Value Maps
         # ----------
 
-        if table in _columns.value_maps:
-            for column in _columns.value_maps[table]:
+        if table in _columns.value_maps_inv:
+            for column in _columns.value_maps_inv[table]:
                 if column not in self.columns:
                     continue
                 self[column] = self[column].map(
-                    invert_dict(_columns.value_maps[table][column])
+                    _columns.value_maps_inv[table][column]
                 )
 
         # Renames
         # -------
 
-        self.rename(
-            columns=invert_dict(_columns.columns_anki2ours[table]), inplace=True
-        )
+        self.rename(columns=_columns.columns_ours2anki[table], inplace=True)
         self.rename(columns={"index": "id"}, inplace=True)
 
         # Dtypes
         # ------
 
         for column, typ in _columns.dtype_casts_back[table].items():
-            self[column] = self[column].astype(typ)
+            if self[column].dtype != typ:
+                self[column] = self[column].astype(typ)
 
         # Unused columns
         # --------------
@@ -1194,10 +1327,8 @@ class AnkiDataFrame(pd.DataFrame):
         if len(self) == 0:
             new = pd.DataFrame(columns=_columns.anki_columns[table])
         else:
-            new = pd.DataFrame(self[_columns.anki_columns[table]])
-        self.drop(self.columns, axis=1, inplace=True)
-        for col in new.columns:
-            self[col] = new[col]
+            new = self[_columns.anki_columns[table]].copy()
+        replace_df_inplace(self, new)
 
         self.check_table_integrity()
 
@@ -1241,19 +1372,6 @@ class AnkiDataFrame(pd.DataFrame):
     # Append
     # ==========================================================================
 
-    def _get_id(self, others=()) -> int:
-        """Generate ID from timestamp and increment if it is already in use.
-
-        .. warning::
-
-            Do not call repeatedly without adding new IDs to index (might
-            produce identical IDs). Rather use :meth:`_get_ids` instead.
-        """
-        idx = int(1000 * time.time())
-        while idx in self.index or idx in others:
-            idx += 1
-        return idx
-
     # todo: documentation
     def add_card(
         self,
@@ -1582,15 +1700,18 @@ class AnkiDataFrame(pd.DataFrame):
             return all_cids
 
     def _get_ids(self, n=1) -> list[int]:
-        """Generate ID from timestamp and increment if it is already in use.
+        """Generate IDs from timestamp.
+
+        Starts past the largest ID already in the index, so the whole batch
+        is unique without probing the index once per ID.
 
         Args:
             n: Number of IDs to generate
         """
-        indices: list[int] = []
-        for _ in range(n):
-            indices.append(self._get_id(others=indices))
-        return indices
+        base = int(1000 * time.time())
+        if len(self.index):
+            base = max(base, int(self.index.max()) + 1)
+        return list(range(base, base + n))
 
     # Todo: If tags single list: Same for all!
     def add_notes(
@@ -1794,10 +1915,14 @@ class AnkiDataFrame(pd.DataFrame):
         # More difficult: Field columns:
         if self._fields_format == "list":
             # Be careful with order!
-            # Also need to flip dimensions
-            known_columns["nflds"] = np.swapaxes(
-                [field_key2field[field_key] for field_key in field_keys], 0, 1
-            ).tolist()
+            # Also need to flip dimensions (field per note, not note per
+            # field); zip does that without building an intermediate array.
+            known_columns["nflds"] = [
+                list(row)
+                for row in zip(
+                    *(field_key2field[field_key] for field_key in field_keys)
+                )
+            ]
         elif self._fields_format == "columns":
             # First we need to make sure that the df has the columns for our
             # model (perhaps this is the first note of this model that we're
@@ -1980,8 +2105,9 @@ class AnkiDataFrame(pd.DataFrame):
             As there are problems with text wrapping in pandas DataFrame, this
             method might change or disappear in the future.
         """
-        help_path = pathlib.Path(__file__).parent / "data" / "anki_fields.csv"
-        df = pd.read_csv(help_path)
+        # Already parsed once at import time; copy so that the filtering and
+        # set_index below never touch the shared table.
+        df = _columns.fields_df.copy()
         if column == "auto":
             column = list(self.columns)
         if table != "all":
@@ -51,6 +51,10 @@ class Collection:
         #: Path to currently loaded database
         self._path: Path = path
 
+        #: Cached database connection (use the :attr:`db` property, which
+        #: reopens it if it was closed)
+        self._db_conn: sqlite3.Connection | None = None
+
         #: Should be accessed with _get_item!
         self.__items: dict[str, AnkiDataFrame | None] = {
             "notes": None,
@@ -72,11 +76,23 @@ class Collection:
 
     @property
     def db(self) -> sqlite3.Connection:
-        """Opened Anki database. Make sure to call `db.close()` after you're
-        done. Better still, use `contextlib.closing`.
+        """Opened Anki database.
+
+        The connection is cached and shared between accesses, so the
+        memoized lookups in :mod:`ankipandas.raw` (which are keyed on the
+        connection) actually hit. Closing it (e.g. via `contextlib.closing`)
+        is harmless: the next access transparently reopens it.
         """
-        log.debug(f"Opening Db from {self._path}")
-        return raw.load_db(self._path)
+        if self._db_conn is not None:
+            try:
+                self._db_conn.execute("SELECT 1")
+            except sqlite3.ProgrammingError:
+                # Connection was closed by a caller; reopen below.
+                self._db_conn = None
+        if self._db_conn is None:
+            log.debug(f"Opening Db from {self._path}")
+            self._db_conn = raw.load_db(self._path)
+        return self._db_conn
 
     def _get_original_item(self, item):
         r = self.__original_items[item]
@@ -361,7 +377,7 @@ class Collection:
         for key in self.__original_items:
             self.__original_items[key] = None
         log.debug("I will now reload the connection.")
-        self._db = raw.load_db(self.path)
+        self._db_conn = raw.load_db(self.path)
         log.info(
             "In case you're running this from a Jupyter notebook, make "
             "sure to shutdown the kernel or delete all ankipandas objects"
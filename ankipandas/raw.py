@@ -41,12 +41,18 @@ CACHE_SIZE = 32
 # ==============================================================================
 
 
-def load_db(path: str | pathlib.PurePath) -> sqlite3.Connection:
+def load_db(
+    path: str | pathlib.PurePath, readonly: bool = False
+) -> sqlite3.Connection:
     """
     Load database from path.
 
     Args:
         path: String or :class:`pathlib.PurePath`.
+        readonly: Open the database in read-only mode. This skips SQLite's
+            write locking and is slightly faster for pure read workloads,
+            but any attempt to write will raise
+            :class:`sqlite3.OperationalError`.
 
     Returns:
         :class:`sqlite3.Connection`
@@ -54,6 +60,8 @@ def load_db(path: str | pathlib.PurePath) -> sqlite3.Connection:
     path = pathlib.Path(path)
     if not path.is_file():
         raise FileNotFoundError(f"Not a file/file not found: {path}")
+    if readonly:
+        return sqlite3.connect(f"file:{path.resolve()}?mode=ro", uri=True)
     return sqlite3.connect(str(path.resolve()))
 
 
@@ -84,8 +92,20 @@ def get_table(db: sqlite3.Connection, table: str) -> pd.DataFrame:
         :class:`pandas.DataFrame`
     """
 
-    df = pd.read_sql_query(f"SELECT * FROM {tables_ours2anki[table]}", db)
-    return df
+    # Read in chunks so that peak memory stays close to one copy of the
+    # table (revlog can reach millions of rows); pd.concat reassembles the
+    # pieces in a single pass.
+    chunks = list(
+        pd.read_sql_query(
+            f"SELECT * FROM {tables_ours2anki[table]}", db, chunksize=100_000
+        )
+    )
+    if not chunks:
+        # Empty table: no chunks are yielded, so query again for the header
+        return pd.read_sql_query(f"SELECT * FROM {tables_ours2anki[table]}", db)
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, copy=False, ignore_index=True)
 
 
 def get_empty_table(table: str) -> pd.DataFrame:
@@ -521,8 +541,8 @@ def get_cid2nid(db: sqlite3.Connection) -> dict[int, int]:
     Returns:
         Dictionary
     """
-    cards = get_table(db, "cards")
-    _cid2nid = dict(zip(cards["id"], cards["nid"]))
+    # Only fetch the two columns we need, not the whole cards table
+    _cid2nid = dict(db.execute("SELECT id, nid FROM cards"))
     return defaultdict(int, _cid2nid)
 
 
@@ -536,8 +556,7 @@ def get_cid2did(db: sqlite3.Connection) -> dict[int, int]:
     Returns:
         Dictionary
     """
-    cards = get_table(db, "cards")
-    _cid2did = dict(zip(cards["id"], cards["did"]))
+    _cid2did = dict(db.execute("SELECT id, did FROM cards"))
     return defaultdict(int, _cid2did)
 
 
@@ -551,6 +570,5 @@ def get_nid2mid(db: sqlite3.Connection) -> dict[int, int]:
     Returns:
         Dictionary
     """
-    notes = get_table(db, "notes")
-    _nid2mid = dict(zip(notes["id"], notes["mid"]))
+    _nid2mid = dict(db.execute("SELECT id, mid FROM notes"))
     return defaultdict(int, _nid2mid)
@@ -582,6 +582,19 @@ class TestAnkiDF(unittest.TestCase):
                 self.assertFalse(val1 == val2)
                 self.assertListEqual(list(val_rest_1), list(val_rest_2))
 
+    def test_set_guid(self):
+        adf = self.nnotes()
+        old_guids = adf["nguid"].copy()
+        adf.loc[adf.index[0], "nguid"] = ""
+        adf._set_guid()
+        new_guid = adf.loc[adf.index[0], "nguid"]
+        self.assertTrue(new_guid)
+        self.assertNotIn(new_guid, list(old_guids))
+        self.assertListEqual(
+            list(adf.loc[adf.index[1:], "nguid"]),
+            list(old_guids[adf.index[1:]]),
+        )
+
     # New
     # ==========================================================================
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 import copy
 import pathlib
 import shutil
+import sqlite3
 import tempfile
 import unittest
 
@@ -45,6 +46,15 @@ class TestRawRead(unittest.TestCase):
             with self.subTest(version=version):
                 assert get_db_version(self.version2db[version]) == version
 
+    def test_load_db_readonly(self):
+        db = load_db(self.db_folder / "collection.anki2", readonly=True)
+        try:
+            assert get_db_version(db) == 0
+            with self.assertRaises(sqlite3.OperationalError):
+                db.execute("CREATE TABLE _scratch (x)")
+        finally:
+            close_db(db)
+
     def tearDown(self):
         for db in self.version2db.values():
             close_db(db)
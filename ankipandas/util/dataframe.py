@@ -3,11 +3,75 @@
 # std
 from __future__ import annotations
 
+from collections import defaultdict
+
 # 3rd
+import numpy as np
 import pandas as pd
 
-# ours
-from ankipandas.util.log import log
+
+def map_with_default(series: pd.Series, mapping: dict) -> pd.Series:
+    """Map a :class:`pandas.Series` through a dictionary.
+
+    Equivalent to ``series.map(mapping)``, but when ``mapping`` is a
+    :class:`collections.defaultdict`, pandas falls back to calling the
+    dictionary once per row (to honor ``__missing__``). Here the lookup is
+    instead done through an intermediate :class:`pandas.Series` (pandas'
+    fast hash-join path) and the default value is filled in afterwards.
+
+    Args:
+        series: :class:`pandas.Series` to map
+        mapping: Dictionary; if it is a ``defaultdict``, its default value
+            is used for keys that are not present.
+
+    Returns:
+        Mapped :class:`pandas.Series`
+    """
+    if not isinstance(mapping, defaultdict) or not mapping:
+        return series.map(mapping)
+    map_series = pd.Series(mapping)
+    mapped = series.map(map_series)
+    if mapped.isna().any():
+        assert mapping.default_factory is not None
+        mapped = mapped.fillna(mapping.default_factory())
+        if mapped.dtype != map_series.dtype:
+            mapped = mapped.astype(map_series.dtype)
+    return mapped
+
+
+def factorized_map(series: pd.Series, mapping: dict) -> pd.Series:
+    """Map a low-cardinality :class:`pandas.Series` through a dictionary.
+
+    The series is factorized first, so the dictionary is consulted only
+    once per distinct value (e.g. once per deck or model) and the result is
+    broadcast back to all rows with a single integer take, rather than
+    probing a hash table once per row.
+
+    Args:
+        series: :class:`pandas.Series` to map
+        mapping: Dictionary; if it is a ``defaultdict``, its default value
+            is used for keys that are not present (matching ``Series.map``).
+
+    Returns:
+        Mapped :class:`pandas.Series`
+    """
+    codes, uniques = pd.factorize(series.values)
+    if isinstance(mapping, defaultdict):
+        assert mapping.default_factory is not None
+        default = mapping.default_factory()
+    else:
+        default = np.nan
+    # Careful: look up with .get, never __getitem__ — a defaultdict would
+    # insert every unseen key, and the mappings from ankipandas.raw are
+    # cached and shared across the whole session.
+    mapped = np.array(
+        [mapping.get(unique, default) for unique in uniques], dtype=object
+    )
+    if (codes < 0).any():
+        # factorize marks NaN entries with -1; route them to the default
+        mapped = np.append(mapped, default)
+        codes = np.where(codes < 0, len(mapped) - 1, codes)
+    return pd.Series(mapped[codes], index=series.index).infer_objects()
 
 
 def _sync_metadata(df_ret: pd.DataFrame, df_old: pd.DataFrame) -> None:
@@ -23,11 +87,12 @@ def _sync_metadata(df_ret: pd.DataFrame, df_old: pd.DataFrame) -> None:
     Returns:
         None
     """
+    # Note: No logging here, because this runs once per copied attribute on
+    # every dataframe operation that syncs metadata, so even a no-op
+    # log.debug call adds up.
     if hasattr(df_old, "_metadata"):
         for key in df_old._metadata:
-            value = getattr(df_old, key)
-            log.debug("Setting metadata attribute %s to %s", key, value)
-            setattr(df_ret, key, value)
+            setattr(df_ret, key, getattr(df_old, key))
 
 
 def replace_df_inplace(df: pd.DataFrame, df_new: pd.DataFrame) -> None:
@@ -43,14 +108,14 @@ def replace_df_inplace(df: pd.DataFrame, df_new: pd.DataFrame) -> None:
     Returns:
         None
     """
-    # Drop all ROWs (not columns)
-    if df.index.any():
+    # Drop all rows first, so that the column drop below never touches data
+    # and the new columns come out in df_new's order.
+    if len(df.index):
         df.drop(df.index, inplace=True)
+    if len(df.columns):
+        df.drop(df.columns, axis=1, inplace=True)
     for col in df_new.columns:
         df[col] = df_new[col]
-    drop_cols = set(df.columns) - set(df_new.columns)
-    if drop_cols:
-        df.drop(drop_cols, axis=1, inplace=True)
     _sync_metadata(df_new, df)
 
 
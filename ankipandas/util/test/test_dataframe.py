@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import unittest
+from collections import defaultdict
 
 # 3rd
 import pandas as pd
 
 # ours
-from ankipandas.util.dataframe import replace_df_inplace
+from ankipandas.util.dataframe import (
+    factorized_map,
+    map_with_default,
+    replace_df_inplace,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -19,6 +24,40 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(len(df.columns), 1)
         self.assertListEqual(list(df["a"].values), [1])
 
+    def test_map_with_default_plain_dict(self):
+        series = pd.Series(["a", "b"])
+        mapped = map_with_default(series, {"a": 1, "b": 2})
+        self.assertListEqual(list(mapped.values), [1, 2])
+
+    def test_map_with_default_missing_key(self):
+        series = pd.Series(["a", "b", "c"])
+        mapping = defaultdict(int, {"a": 1, "b": 2})
+        mapped = map_with_default(series, mapping)
+        self.assertListEqual(list(mapped.values), [1, 2, 0])
+        self.assertEqual(mapped.dtype, pd.Series(mapping).dtype)
+
+    def test_factorized_map(self):
+        series = pd.Series(["a", "b", "a", "a"], index=[3, 1, 4, 2])
+        mapped = factorized_map(series, {"a": 1, "b": 2})
+        self.assertListEqual(list(mapped.values), [1, 2, 1, 1])
+        self.assertListEqual(list(mapped.index), [3, 1, 4, 2])
+        self.assertEqual(mapped.dtype, "int64")
+
+    def test_factorized_map_default(self):
+        series = pd.Series(["a", "x", None])
+        mapped = factorized_map(series, defaultdict(int, {"a": 1}))
+        self.assertListEqual(list(mapped.values), [1, 0, 0])
+
+    def test_factorized_map_does_not_mutate_mapping(self):
+        mapping = defaultdict(int, {"a": 1})
+        factorized_map(pd.Series(["a", "x"]), mapping)
+        self.assertDictEqual(dict(mapping), {"a": 1})
+
+    def test_map_with_default_empty_mapping(self):
+        series = pd.Series([1, 2])
+        mapped = map_with_default(series, defaultdict(str))
+        self.assertListEqual(list(mapped.values), ["", ""])
+
 
 if __name__ == "__main__":
     unittest.main()